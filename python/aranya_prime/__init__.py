@@ -3,32 +3,87 @@ Aranya Prime (Rust Edition)
 High-performance computational kernels powered by Rust, PyO3, and Rayon.
 """
 
+import warnings as _warnings
+
+import numpy as _np
+
 from ._aranya_prime import (
-    prime_poly,
+    prime_poly, prime_polyval, prime_polyval_batch, prime_chebval, prime_roots,
     prime_sin, prime_cos, prime_tan,
     prime_math_sum, prime_sub, prime_mul, prime_div,
     prime_dot, prime_mag, prime_normalize,
-    prime_matmul, prime_normalize_batch,
+    prime_matmul, prime_normalize_batch, prime_normalize_batch_inplace,
     prime_scale, prime_rotate_2d,
     prime_sum, prime_mean, prime_std, prime_clip,
     prime_l2_norm, prime_linf_norm,
     prime_convolve,
     prime_fft, prime_ifft,
     prime_dct, prime_wavelet_transform,
+    # streaming filters & windows
+    PrimeFIR, PrimeIIR, prime_window,
     # f32 variants
     prime_sin_f32, prime_cos_f32, prime_tan_f32,
     prime_dot_f32, prime_matmul_f32, prime_rotate_2d_f32,
     # streaming
     prime_chunked_sin, prime_chunked_rotate_2d,
     # BLAS / LAPACK
-    prime_blas_dot, prime_blas_matmul, prime_svd,
+    prime_blas_dot, prime_blas_matmul, prime_svd, prime_svd_inplace,
+    # CPU feature dispatch
+    prime_cpu_features, prime_force_isa,
 )
 
+# ── CPU Feature Dispatch ──────────────────────────────────────────────────────
+def cpu_features():
+    """
+    Detected CPU features and the SIMD variant hot kernels dispatch to.
+    The variant is picked once at import; set AP_FORCE_ISA to override it.
+    """
+    return prime_cpu_features()
+
+def force_isa(name):
+    """
+    Switch the SIMD variant ("generic", "avx2", "avx512" or "auto") at runtime.
+    Intended for benchmarking; returns the name of the now-active variant.
+    """
+    return prime_force_isa(name)
+
+# Surface an ignored AP_FORCE_ISA (typo or ISA missing on this host) as a
+# warning rather than failing the import.
+_fallback = prime_cpu_features()["fallback"]
+if _fallback:
+    _warnings.warn(_fallback, RuntimeWarning, stacklevel=2)
+
 # ── Polynomials ────────────────────────────────────────────────────────────────
 def polynomial(x):
     """Evaluates x³ + x² + x element-wise (Rayon parallel)."""
     return prime_poly(x)
 
+def polyval(coeffs, x, method="auto"):
+    """
+    Evaluates a polynomial (coefficients highest degree first, like np.polyval).
+    method: "horner", "estrin", or "auto" (Estrin for degree >= 12).
+    """
+    return prime_polyval(coeffs, x, method)
+
+def polyval_batch(coeffs, X, method="auto"):
+    """
+    Evaluates polynomial coeffs[i] on row X[i] for every row, in parallel.
+    coeffs is (n_polys, degree + 1); X is (n_polys, n_samples).
+    """
+    return prime_polyval_batch(coeffs, X, method)
+
+def chebval(c, x):
+    """Evaluates a Chebyshev series (lowest degree first, like np.polynomial.chebyshev.chebval)."""
+    return prime_chebval(c, x)
+
+def roots(coeffs):
+    """
+    Polynomial roots via LAPACK companion-matrix eigenvalues (like np.roots).
+    Returns a complex128 array.
+    """
+    re, im = prime_roots(coeffs)
+    return re + 1j * im
+
 # ── Trigonometry ──────────────────────────────────────────────────────────────
 def sin(x): return prime_sin(x)
 def cos(x): return prime_cos(x)
@@ -81,15 +136,34 @@ def matmul(A, B, auto_dispatch=True):
             return prime_blas_matmul(A, B)
     return prime_matmul(A, B)
 
-def svd(A):
+def svd(A, overwrite_a=False):
     """
     Fortran-backed SVD via LAPACK (dgesvd).
     Returns (U, S, Vh) matching np.linalg.svd.
+
+    With overwrite_a=True, LAPACK works directly in A's buffer (no full-size
+    copy) and A's contents are destroyed. Like SciPy, this only applies to
+    writeable, contiguous float64 arrays; anything else is copied as usual.
     """
+    if (overwrite_a and isinstance(A, _np.ndarray) and A.dtype == _np.float64
+            and A.flags.writeable and (A.flags.c_contiguous or A.flags.f_contiguous)):
+        return prime_svd_inplace(A)
     return prime_svd(A)
 
-def normalize_batch(X):
-    """Row-wise L2 normalization of a 2D matrix."""
+def normalize_batch(X, inplace=False):
+    """
+    Row-wise L2 normalization of a 2D matrix.
+
+    With inplace=True, X (a writeable float64 array) is overwritten and
+    returned, so no second full-size matrix is allocated.
+    """
+    if inplace:
+        if not isinstance(X, _np.ndarray) or X.dtype != _np.float64:
+            raise TypeError("normalize_batch(inplace=True) needs a float64 ndarray")
+        if not X.flags.writeable:
+            raise ValueError("normalize_batch(inplace=True) needs a writeable array")
+        prime_normalize_batch_inplace(X)
+        return X
     return prime_normalize_batch(X)
 
 # ── Transforms ────────────────────────────────────────────────────────────────
@@ -154,6 +228,41 @@ class StreamNamespace:
         """Parallel 2D rotation with explicit cache-sized chunks."""
         return prime_chunked_rotate_2d(x, y, angle_rad, chunk_size)
 
+# ── Signal Filters & Windows Sub-namespace ────────────────────────────────────
+class SignalNamespace:
+    """
+    Sub-namespace for stateful streaming filters and cached window functions.
+
+    FIR(taps, channels=1) / IIR(sos, channels=1) keep their delay lines in Rust:
+    feed blocks with .process(x) (1D) or .process_channels(X) (channels, samples).
+    """
+    FIR = PrimeFIR
+    IIR = PrimeIIR
+
+    @staticmethod
+    def window(kind, n, beta=0.0):
+        """Window by name: "hann", "hamming", "blackman" or "kaiser" (uses beta)."""
+        return prime_window(kind, n, beta)
+
+    @staticmethod
+    def hann(n):
+        """Symmetric Hann window (matches np.hanning). Cached per length."""
+        return prime_window("hann", n)
+    @staticmethod
+    def hamming(n):
+        """Symmetric Hamming window (matches np.hamming). Cached per length."""
+        return prime_window("hamming", n)
+    @staticmethod
+    def blackman(n):
+        """Symmetric Blackman window (matches np.blackman). Cached per length."""
+        return prime_window("blackman", n)
+    @staticmethod
+    def kaiser(n, beta):
+        """Kaiser window (matches np.kaiser). Cached per (length, beta)."""
+        return prime_window("kaiser", n, beta)
+
+signal = SignalNamespace()
+
 def blas_info():
     """Return information about the BLAS/LAPACK backend used by NumPy.
 
@@ -3,12 +3,20 @@ Type stubs for the compiled Rust/PyO3 extension module `_aranya_prime`.
 These are used by Pyright / Pylance for static analysis only.
 """
 
-from typing import Tuple
+from typing import Any, Dict, Tuple
 import numpy as np
 from numpy.typing import ArrayLike, NDArray
 
+# ── CPU Feature Dispatch ──────────────────────────────────────────────────────
+def prime_cpu_features() -> Dict[str, Any]: ...
+def prime_force_isa(name: str) -> str: ...
+
 # ── Polynomials ────────────────────────────────────────────────────────────────
 def prime_poly(x: ArrayLike) -> NDArray[np.float64]: ...
+def prime_polyval(coeffs: ArrayLike, x: ArrayLike, method: str = ...) -> NDArray[np.float64]: ...
+def prime_polyval_batch(coeffs: ArrayLike, X: ArrayLike, method: str = ...) -> NDArray[np.float64]: ...
+def prime_chebval(c: ArrayLike, x: ArrayLike) -> NDArray[np.float64]: ...
+def prime_roots(coeffs: ArrayLike) -> Tuple[NDArray[np.float64], NDArray[np.float64]]: ...
 
 # ── Trigonometry ──────────────────────────────────────────────────────────────
 def prime_sin(x: ArrayLike) -> NDArray[np.float64]: ...
@@ -29,6 +37,7 @@ def prime_normalize(x: ArrayLike) -> NDArray[np.float64]: ...
 # ── Linear Algebra (2D) ───────────────────────────────────────────────────────
 def prime_matmul(A: ArrayLike, B: ArrayLike) -> NDArray[np.float64]: ...
 def prime_normalize_batch(X: ArrayLike) -> NDArray[np.float64]: ...
+def prime_normalize_batch_inplace(X: NDArray[np.float64]) -> None: ...
 
 # ── Statistics & Norms ────────────────────────────────────────────────────────
 def prime_sum(x: ArrayLike) -> float: ...
@@ -50,6 +59,27 @@ def prime_fft(x: ArrayLike) -> Tuple[NDArray[np.float64], NDArray[np.float64]]:
 def prime_ifft(re: ArrayLike, im: ArrayLike) -> NDArray[np.float64]: ...
 def prime_dct(x: ArrayLike) -> NDArray[np.float64]: ...
 def prime_wavelet_transform(x: ArrayLike) -> NDArray[np.float64]: ...
+def prime_window(kind: str, n: int, beta: float = ...) -> NDArray[np.float64]: ...
+
+class PrimeFIR:
+    def __init__(self, taps: ArrayLike, channels: int = ...) -> None: ...
+    def process(self, x: ArrayLike) -> NDArray[np.float64]: ...
+    def process_channels(self, x: ArrayLike) -> NDArray[np.float64]: ...
+    def reset(self) -> None: ...
+    @property
+    def channels(self) -> int: ...
+    @property
+    def taps(self) -> NDArray[np.float64]: ...
+
+class PrimeIIR:
+    def __init__(self, sos: ArrayLike, channels: int = ...) -> None: ...
+    def process(self, x: ArrayLike) -> NDArray[np.float64]: ...
+    def process_channels(self, x: ArrayLike) -> NDArray[np.float64]: ...
+    def reset(self) -> None: ...
+    @property
+    def channels(self) -> int: ...
+    @property
+    def n_sections(self) -> int: ...
 
 # ── Single-precision (f32) variants ───────────────────────────────────────────
 def prime_sin_f32(x: ArrayLike) -> NDArray[np.float32]: ...
@@ -67,3 +97,4 @@ def prime_chunked_rotate_2d(x: ArrayLike, y: ArrayLike, angle_rad: float, chunk_
 def prime_blas_dot(x: ArrayLike, y: ArrayLike) -> float: ...
 def prime_blas_matmul(A: ArrayLike, B: ArrayLike) -> NDArray[np.float64]: ...
 def prime_svd(A: ArrayLike) -> Tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]: ...
+def prime_svd_inplace(A: NDArray[np.float64]) -> Tuple[NDArray[np.float64], NDArray[np.float64], NDArray[np.float64]]: ...
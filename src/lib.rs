@@ -5,10 +5,18 @@ use pyo3::prelude::*;
 
 mod linalg;
 mod math;
+mod simd;
 mod transform;
 
 #[pymodule]
 fn _aranya_prime(m: &Bound<'_, PyModule>) -> PyResult<()> {
+    // ── CPU Feature Dispatch ───────────────────────────────────────────
+    // Pick the SIMD variant once, before any kernel can run. A bad
+    // AP_FORCE_ISA falls back to the best variant; Python warns about it.
+    simd::init();
+    m.add_function(wrap_pyfunction!(simd::cpu::prime_cpu_features, m)?)?;
+    m.add_function(wrap_pyfunction!(simd::cpu::prime_force_isa, m)?)?;
+
     // ── Array Operations ───────────────────────────────────────────────
     m.add_function(wrap_pyfunction!(math::array_ops::prime_math_sum, m)?)?;
     m.add_function(wrap_pyfunction!(math::array_ops::prime_sub, m)?)?;
@@ -30,6 +38,10 @@ fn _aranya_prime(m: &Bound<'_, PyModule>) -> PyResult<()> {
 
     // ── Polynomials ───────────────────────────────────────────────────
     m.add_function(wrap_pyfunction!(math::poly::prime_poly, m)?)?;
+    m.add_function(wrap_pyfunction!(math::poly::prime_polyval, m)?)?;
+    m.add_function(wrap_pyfunction!(math::poly::prime_polyval_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(math::poly::prime_chebval, m)?)?;
+    m.add_function(wrap_pyfunction!(math::poly::prime_roots, m)?)?;
 
     // ── Convolution ───────────────────────────────────────────────────
     m.add_function(wrap_pyfunction!(math::convolve::prime_convolve, m)?)?;
@@ -38,6 +50,11 @@ fn _aranya_prime(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(math::fft::prime_fft, m)?)?;
     m.add_function(wrap_pyfunction!(math::fft::prime_ifft, m)?)?;
 
+    // ── Streaming Filters & Windows ───────────────────────────────────
+    m.add_class::<math::filters::PrimeFir>()?;
+    m.add_class::<math::filters::PrimeIir>()?;
+    m.add_function(wrap_pyfunction!(math::window::prime_window, m)?)?;
+
     // ── DCT & Wavelet ─────────────────────────────────────────────────
     m.add_function(wrap_pyfunction!(math::dct_wavelet::prime_dct, m)?)?;
     m.add_function(wrap_pyfunction!(math::dct_wavelet::prime_wavelet_transform, m)?)?;
@@ -50,11 +67,13 @@ fn _aranya_prime(m: &Bound<'_, PyModule>) -> PyResult<()> {
     // ── Linear Algebra (2D) ───────────────────────────────────────────
     m.add_function(wrap_pyfunction!(linalg::matmul::prime_matmul, m)?)?;
     m.add_function(wrap_pyfunction!(linalg::matmul::prime_normalize_batch, m)?)?;
+    m.add_function(wrap_pyfunction!(linalg::matmul::prime_normalize_batch_inplace, m)?)?;
 
     // ── BLAS / LAPACK (Fortran FFI) ───────────────────────────────────
     m.add_function(wrap_pyfunction!(linalg::blas_ops::prime_blas_dot, m)?)?;
     m.add_function(wrap_pyfunction!(linalg::blas_ops::prime_blas_matmul, m)?)?;
     m.add_function(wrap_pyfunction!(linalg::blas_ops::prime_svd, m)?)?;
+    m.add_function(wrap_pyfunction!(linalg::blas_ops::prime_svd_inplace, m)?)?;
 
     // ── Transforms ────────────────────────────────────────────────────
     m.add_function(wrap_pyfunction!(transform::prime_scale, m)?)?;
@@ -1,7 +1,7 @@
-use numpy::{IntoPyArray, PyReadonlyArray1, PyReadonlyArray2};
+use numpy::{IntoPyArray, PyReadonlyArray1, PyReadonlyArray2, PyReadwriteArray2};
 use pyo3::prelude::*;
 use ndarray::prelude::*;
-use ndarray_linalg::SVDInto;
+use ndarray_linalg::{SVDInplace, SVDInto};
 
 /// BLAS-accelerated Dot Product.
 /// Uses the system's optimized BLAS (OpenBLAS/MKL) for large vector reduction.
@@ -57,6 +57,44 @@ pub fn prime_svd<'py>(
             .svd_into(true, true)
             .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
 
+    svd_outputs(py, u_opt, s, vt_opt)
+}
+
+/// LAPACK SVD that works directly in the caller's buffer (`overwrite_a`).
+///
+/// `dgesvd` uses A as its workspace, so no full-size copy of the input is
+/// made; on return the contents of A are destroyed. A must be C- or
+/// Fortran-contiguous. Returns (U, S, Vh) like `prime_svd`.
+#[pyfunction]
+pub fn prime_svd_inplace<'py>(
+    py: Python<'py>,
+    mut a: PyReadwriteArray2<'py, f64>,
+) -> PyResult<(
+    Bound<'py, numpy::PyArray2<f64>>,
+    Bound<'py, numpy::PyArray1<f64>>,
+    Bound<'py, numpy::PyArray2<f64>>,
+)> {
+    let mut a_view = a.as_array_mut();
+
+    let (u_opt, s, vt_opt): (Option<Array2<f64>>, Array1<f64>, Option<Array2<f64>>) =
+        a_view
+            .svd_inplace(true, true)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(e.to_string()))?;
+
+    svd_outputs(py, u_opt, s, vt_opt)
+}
+
+/// Unwraps the optional SVD factors and hands all three to NumPy.
+fn svd_outputs<'py>(
+    py: Python<'py>,
+    u_opt: Option<Array2<f64>>,
+    s: Array1<f64>,
+    vt_opt: Option<Array2<f64>>,
+) -> PyResult<(
+    Bound<'py, numpy::PyArray2<f64>>,
+    Bound<'py, numpy::PyArray1<f64>>,
+    Bound<'py, numpy::PyArray2<f64>>,
+)> {
     let u = u_opt
         .ok_or_else(|| PyErr::new::<pyo3::exceptions::PyRuntimeError, _>(
             "SVD did not compute U"))?;
@@ -2,7 +2,11 @@ use numpy::{IntoPyArray, PyReadonlyArray1};
 use pyo3::prelude::*;
 use rayon::prelude::*;
 
+use crate::simd;
+
 /// Computes the dot product using a parallel reduction.
+///
+/// Each Rayon task runs the SIMD variant selected at module init.
 #[pyfunction]
 pub fn prime_dot(x: PyReadonlyArray1<f64>, y: PyReadonlyArray1<f64>) -> PyResult<f64> {
     let xs = x.as_slice()?;
@@ -10,7 +14,11 @@ pub fn prime_dot(x: PyReadonlyArray1<f64>, y: PyReadonlyArray1<f64>) -> PyResult
     if xs.len() != ys.len() {
         return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>("Array size mismatch"));
     }
-    let result: f64 = xs.par_iter().zip(ys.par_iter()).map(|(&a, &b)| a * b).sum();
+    let result: f64 = xs
+        .par_chunks(simd::CHUNK)
+        .zip(ys.par_chunks(simd::CHUNK))
+        .map(|(a, b)| simd::dot_f64(a, b))
+        .sum();
     Ok(result)
 }
 
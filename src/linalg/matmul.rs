@@ -1,4 +1,5 @@
-use numpy::{IntoPyArray, PyReadonlyArray2};
+use numpy::ndarray::Axis;
+use numpy::{IntoPyArray, PyReadonlyArray2, PyReadwriteArray2};
 use pyo3::prelude::*;
 use rayon::prelude::*;
 
@@ -30,6 +31,15 @@ pub fn prime_matmul<'py>(
     Ok(result.into_pyarray(py))
 }
 
+/// Divides `row` by its L2 norm (all-zero rows are left untouched).
+#[inline]
+fn normalize_row(row: &mut [f64]) {
+    let norm = row.iter().map(|&v| v * v).sum::<f64>().sqrt();
+    if norm > 0.0 {
+        row.iter_mut().for_each(|v| *v /= norm);
+    }
+}
+
 /// Row-wise L2 normalization of a 2D matrix.
 ///
 /// Each row of X is divided by its L2 norm. Rows are processed in parallel.
@@ -41,17 +51,112 @@ pub fn prime_normalize_batch<'py>(
     let x_arr = x.as_array();
     let (m, n) = (x_arr.nrows(), x_arr.ncols());
 
+    // The only copy: the result buffer, which is handed to NumPy without another.
     let mut flat: Vec<f64> = x_arr.iter().cloned().collect();
 
-    flat.par_chunks_mut(n).for_each(|row| {
-        let norm = row.iter().map(|&v| v * v).sum::<f64>().sqrt();
-        if norm > 0.0 {
-            row.iter_mut().for_each(|v| *v /= norm);
-        }
-    });
+    if n > 0 {
+        flat.par_chunks_mut(n).for_each(normalize_row);
+    }
 
     let result = numpy::ndarray::Array2::from_shape_vec((m, n), flat)
         .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
 
     Ok(result.into_pyarray(py))
 }
+
+/// Rows per Rayon task when summing row norms of a Fortran-order matrix.
+const ROW_BLOCK: usize = 1024;
+
+/// Sums of squares per row of a column-major matrix (`m` rows, columns of
+/// length `m` stored back to back in `data`).
+///
+/// Tall matrices split the rows into `ROW_BLOCK` blocks, each task sweeping
+/// every column over its rows. When that would leave threads idle (few rows,
+/// many columns), the columns are split across tasks instead, each task
+/// producing partial row sums that are then added up; with fewer rows than
+/// `ROW_BLOCK * threads`, those partial vectors stay small.
+fn row_sum_squares_col_major(data: &[f64], m: usize) -> Vec<f64> {
+    let n = data.len() / m;
+    let threads = rayon::current_num_threads();
+
+    if m.div_ceil(ROW_BLOCK) >= threads || n < 2 {
+        let mut sums = vec![0.0; m];
+        sums.par_chunks_mut(ROW_BLOCK).enumerate().for_each(|(b, acc)| {
+            let rows = b * ROW_BLOCK..b * ROW_BLOCK + acc.len();
+            for col in data.chunks_exact(m) {
+                for (a, &v) in acc.iter_mut().zip(&col[rows.clone()]) {
+                    *a += v * v;
+                }
+            }
+        });
+        return sums;
+    }
+
+    let cols_per_task = n.div_ceil(threads);
+    data.par_chunks(cols_per_task * m)
+        .map(|block| {
+            let mut acc = vec![0.0; m];
+            for col in block.chunks_exact(m) {
+                for (a, &v) in acc.iter_mut().zip(col) {
+                    *a += v * v;
+                }
+            }
+            acc
+        })
+        .reduce(
+            || vec![0.0; m],
+            |mut a, b| {
+                a.iter_mut().zip(&b).for_each(|(x, &y)| *x += y);
+                a
+            },
+        )
+}
+
+/// Row-wise L2 normalization of a column-major (m, n) matrix stored in `cols`.
+///
+/// Rows are strided here, so instead of walking them the row norms are
+/// accumulated with contiguous column sweeps (parallel over row or column
+/// blocks, whichever keeps every thread busy), and the columns are then
+/// scaled in parallel. Both passes read memory linearly.
+fn normalize_rows_col_major(cols: &mut [f64], m: usize) {
+    let mut norms = row_sum_squares_col_major(cols, m);
+    norms.iter_mut().for_each(|a| *a = a.sqrt());
+
+    cols.par_chunks_mut(m).for_each(|col| {
+        for (v, &norm) in col.iter_mut().zip(&norms) {
+            if norm > 0.0 {
+                *v /= norm;
+            }
+        }
+    });
+}
+
+/// In-place row-wise L2 normalization: overwrites X without a full-size copy.
+///
+/// All layouts run in parallel: C-contiguous inputs row by row, Fortran-order
+/// inputs via column sweeps, and other strided views one row per task.
+#[pyfunction]
+pub fn prime_normalize_batch_inplace(mut x: PyReadwriteArray2<'_, f64>) -> PyResult<()> {
+    let mut x_arr = x.as_array_mut();
+    let (m, n) = (x_arr.nrows(), x_arr.ncols());
+    if m == 0 || n == 0 {
+        return Ok(());
+    }
+
+    if x_arr.is_standard_layout() {
+        let flat = x_arr.as_slice_mut().expect("standard layout is contiguous");
+        flat.par_chunks_mut(n).for_each(normalize_row);
+    } else if x_arr.t().is_standard_layout() {
+        let mut cols = x_arr.view_mut().reversed_axes();
+        let flat = cols.as_slice_mut().expect("Fortran layout is contiguous");
+        normalize_rows_col_major(flat, m);
+    } else {
+        x_arr.axis_iter_mut(Axis(0)).into_par_iter().for_each(|mut row| {
+            let norm = row.iter().map(|&v| v * v).sum::<f64>().sqrt();
+            if norm > 0.0 {
+                row.mapv_inplace(|v| v / norm);
+            }
+        });
+    }
+    Ok(())
+}
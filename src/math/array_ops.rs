@@ -2,6 +2,9 @@ use numpy::{IntoPyArray, PyReadonlyArray1};
 use pyo3::prelude::*;
 use rayon::prelude::*;
 
+use crate::simd;
+
+/// Element-wise addition, dispatched to the SIMD variant selected at init.
 #[pyfunction]
 pub fn prime_math_sum<'py>(
     py: Python<'py>,
@@ -13,7 +16,11 @@ pub fn prime_math_sum<'py>(
     if xs.len() != ys.len() {
         return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>("Array size mismatch"));
     }
-    let result: Vec<f64> = xs.par_iter().zip(ys.par_iter()).map(|(&a, &b)| a + b).collect();
+    let mut result = vec![0.0; xs.len()];
+    result
+        .par_chunks_mut(simd::CHUNK)
+        .zip(xs.par_chunks(simd::CHUNK).zip(ys.par_chunks(simd::CHUNK)))
+        .for_each(|(out, (a, b))| simd::add_f64(a, b, out));
     Ok(result.into_pyarray(py))
 }
 
@@ -2,6 +2,8 @@ use numpy::{IntoPyArray, PyReadonlyArray1, PyReadonlyArray2};
 use pyo3::prelude::*;
 use rayon::prelude::*;
 
+use crate::simd;
+
 #[pyfunction]
 pub fn prime_sin_f32<'py>(py: Python<'py>, x: PyReadonlyArray1<'py, f32>) -> PyResult<Bound<'py, numpy::PyArray1<f32>>> {
     let result: Vec<f32> = x.as_slice()?.par_iter().map(|&a| a.sin()).collect();
@@ -27,7 +29,11 @@ pub fn prime_dot_f32(x: PyReadonlyArray1<f32>, y: PyReadonlyArray1<f32>) -> PyRe
     if xs.len() != ys.len() {
         return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>("Array size mismatch"));
     }
-    Ok(xs.par_iter().zip(ys.par_iter()).map(|(&a, &b)| a * b).sum())
+    Ok(xs
+        .par_chunks(simd::CHUNK)
+        .zip(ys.par_chunks(simd::CHUNK))
+        .map(|(a, b)| simd::dot_f32(a, b))
+        .sum())
 }
 
 #[pyfunction]
@@ -80,11 +86,14 @@ pub fn prime_rotate_2d_f32<'py>(
     let c = angle_rad.cos();
     let s = angle_rad.sin();
 
-    let (res_x, res_y): (Vec<f32>, Vec<f32>) = xs
-        .par_iter()
-        .zip(ys.par_iter())
-        .map(|(&px, &py_val)| (px * c - py_val * s, px * s + py_val * c))
-        .unzip();
+    let mut res_x = vec![0.0_f32; xs.len()];
+    let mut res_y = vec![0.0_f32; xs.len()];
+
+    res_x
+        .par_chunks_mut(simd::CHUNK)
+        .zip(res_y.par_chunks_mut(simd::CHUNK))
+        .zip(xs.par_chunks(simd::CHUNK).zip(ys.par_chunks(simd::CHUNK)))
+        .for_each(|((ox, oy), (px, py_val))| simd::rotate_f32(px, py_val, c, s, ox, oy));
 
     Ok((res_x.into_pyarray(py), res_y.into_pyarray(py)))
 }
@@ -0,0 +1,251 @@
+use numpy::{IntoPyArray, PyReadonlyArray1, PyReadonlyArray2};
+use pyo3::prelude::*;
+use rayon::prelude::*;
+
+/// Output samples computed per Rayon task inside one FIR channel. Blocks no
+/// longer than this are filtered on the calling thread, so small streaming
+/// blocks never pay for a round-trip through the Rayon pool.
+const FIR_CHUNK: usize = 4096;
+
+/// Computes `out[j] = y[start + j]` from the extended input `ext`
+/// (history followed by the block).
+#[inline]
+fn fir_range(taps: &[f64], ext: &[f64], start: usize, out: &mut [f64]) {
+    let hist = taps.len() - 1;
+    for (j, y) in out.iter_mut().enumerate() {
+        // ext[start + j + hist] is x[n]; walk backwards through the taps.
+        let window = &ext[start + j..=start + j + hist];
+        *y = taps.iter().zip(window.iter().rev()).map(|(&h, &v)| h * v).sum();
+    }
+}
+
+/// Filters one block through an FIR delay line.
+///
+/// `line` holds the last `taps.len() - 1` input samples followed by the new
+/// block; on return it is trimmed back to just the history for the next call.
+/// Its capacity is kept, so steady-state streaming performs no allocation.
+fn fir_block(taps: &[f64], line: &mut Vec<f64>, block: impl Iterator<Item = f64>, out: &mut [f64]) {
+    let hist = taps.len() - 1;
+    line.extend(block);
+
+    let ext: &[f64] = &line[..];
+    if out.len() <= FIR_CHUNK {
+        fir_range(taps, ext, 0, out);
+    } else {
+        out.par_chunks_mut(FIR_CHUNK)
+            .enumerate()
+            .for_each(|(ci, chunk)| fir_range(taps, ext, ci * FIR_CHUNK, chunk));
+    }
+
+    line.drain(..line.len() - hist);
+}
+
+/// Runs one block through a cascade of biquads (transposed direct form II).
+///
+/// `sos` holds `[b0, b1, b2, a1, a2]` per section, already normalized by a0;
+/// `state` holds the two delay registers per section.
+fn sos_block(sos: &[[f64; 5]], state: &mut [f64], block: impl Iterator<Item = f64>, out: &mut [f64]) {
+    for (x, y) in block.zip(out.iter_mut()) {
+        let mut v = x;
+        for (s, z) in sos.iter().zip(state.chunks_exact_mut(2)) {
+            let w = s[0] * v + z[0];
+            z[0] = s[1] * v - s[3] * w + z[1];
+            z[1] = s[2] * v - s[4] * w;
+            v = w;
+        }
+        *y = v;
+    }
+}
+
+fn channel_mismatch(expected: usize, got: usize) -> PyErr {
+    PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+        "Filter has {expected} channel(s) but input has {got} row(s)"
+    ))
+}
+
+/// Stateful FIR filter: y[n] = Σ taps[k] · x[n - k].
+///
+/// The taps and one delay line per channel live in Rust, so consecutive
+/// blocks are filtered exactly as if the whole stream had been passed at once.
+#[pyclass(name = "PrimeFIR")]
+pub struct PrimeFir {
+    taps: Vec<f64>,
+    lines: Vec<Vec<f64>>,
+}
+
+#[pymethods]
+impl PrimeFir {
+    #[new]
+    #[pyo3(signature = (taps, channels=1))]
+    fn new(taps: PyReadonlyArray1<'_, f64>, channels: usize) -> PyResult<Self> {
+        let taps = taps.as_array().to_vec();
+        if taps.is_empty() {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>("FIR needs at least one tap"));
+        }
+        if channels == 0 {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>("channels must be >= 1"));
+        }
+        let lines = vec![vec![0.0; taps.len() - 1]; channels];
+        Ok(PrimeFir { taps, lines })
+    }
+
+    /// Filters one single-channel block, carrying state into the next call.
+    fn process<'py>(
+        &mut self,
+        py: Python<'py>,
+        x: PyReadonlyArray1<'py, f64>,
+    ) -> PyResult<Bound<'py, numpy::PyArray1<f64>>> {
+        if self.lines.len() != 1 {
+            return Err(channel_mismatch(self.lines.len(), 1));
+        }
+        let xs = x.as_array();
+        let mut out = vec![0.0; xs.len()];
+        fir_block(&self.taps, &mut self.lines[0], xs.iter().copied(), &mut out);
+        Ok(out.into_pyarray(py))
+    }
+
+    /// Filters a (channels, samples) block; channels run in parallel.
+    fn process_channels<'py>(
+        &mut self,
+        py: Python<'py>,
+        x: PyReadonlyArray2<'py, f64>,
+    ) -> PyResult<Bound<'py, numpy::PyArray2<f64>>> {
+        let xa = x.as_array();
+        let (rows, n) = (xa.nrows(), xa.ncols());
+        if rows != self.lines.len() {
+            return Err(channel_mismatch(self.lines.len(), rows));
+        }
+
+        let taps = &self.taps;
+        let mut flat = vec![0.0; rows * n];
+        if n > 0 {
+            self.lines
+                .par_iter_mut()
+                .zip(flat.par_chunks_mut(n))
+                .enumerate()
+                .for_each(|(c, (line, out))| fir_block(taps, line, xa.row(c).iter().copied(), out));
+        }
+
+        let result = numpy::ndarray::Array2::from_shape_vec((rows, n), flat)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+        Ok(result.into_pyarray(py))
+    }
+
+    /// Clears the delay lines (as if no samples had been seen).
+    fn reset(&mut self) {
+        for line in self.lines.iter_mut() {
+            line.iter_mut().for_each(|v| *v = 0.0);
+        }
+    }
+
+    #[getter]
+    fn channels(&self) -> usize {
+        self.lines.len()
+    }
+
+    #[getter]
+    fn taps<'py>(&self, py: Python<'py>) -> Bound<'py, numpy::PyArray1<f64>> {
+        self.taps.clone().into_pyarray(py)
+    }
+}
+
+/// Stateful IIR filter made of second-order sections.
+///
+/// `sos` has shape (n_sections, 6) with rows `[b0, b1, b2, a0, a1, a2]`,
+/// the same layout as `scipy.signal.sosfilt`.
+#[pyclass(name = "PrimeIIR")]
+pub struct PrimeIir {
+    sos: Vec<[f64; 5]>,
+    state: Vec<f64>,
+    channels: usize,
+}
+
+#[pymethods]
+impl PrimeIir {
+    #[new]
+    #[pyo3(signature = (sos, channels=1))]
+    fn new(sos: PyReadonlyArray2<'_, f64>, channels: usize) -> PyResult<Self> {
+        let sa = sos.as_array();
+        if sa.ncols() != 6 || sa.nrows() == 0 {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                "sos must have shape (n_sections, 6), got ({}, {})",
+                sa.nrows(),
+                sa.ncols()
+            )));
+        }
+        if channels == 0 {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>("channels must be >= 1"));
+        }
+
+        let mut sections = Vec::with_capacity(sa.nrows());
+        for row in sa.rows() {
+            let a0 = row[3];
+            if a0 == 0.0 {
+                return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(
+                    "sos section has a0 == 0",
+                ));
+            }
+            sections.push([row[0] / a0, row[1] / a0, row[2] / a0, row[4] / a0, row[5] / a0]);
+        }
+
+        let state = vec![0.0; channels * sections.len() * 2];
+        Ok(PrimeIir { sos: sections, state, channels })
+    }
+
+    /// Filters one single-channel block, carrying state into the next call.
+    fn process<'py>(
+        &mut self,
+        py: Python<'py>,
+        x: PyReadonlyArray1<'py, f64>,
+    ) -> PyResult<Bound<'py, numpy::PyArray1<f64>>> {
+        if self.channels != 1 {
+            return Err(channel_mismatch(self.channels, 1));
+        }
+        let xs = x.as_array();
+        let mut out = vec![0.0; xs.len()];
+        sos_block(&self.sos, &mut self.state, xs.iter().copied(), &mut out);
+        Ok(out.into_pyarray(py))
+    }
+
+    /// Filters a (channels, samples) block; channels run in parallel.
+    fn process_channels<'py>(
+        &mut self,
+        py: Python<'py>,
+        x: PyReadonlyArray2<'py, f64>,
+    ) -> PyResult<Bound<'py, numpy::PyArray2<f64>>> {
+        let xa = x.as_array();
+        let (rows, n) = (xa.nrows(), xa.ncols());
+        if rows != self.channels {
+            return Err(channel_mismatch(self.channels, rows));
+        }
+
+        let sos = &self.sos;
+        let mut flat = vec![0.0; rows * n];
+        if n > 0 {
+            self.state
+                .par_chunks_mut(sos.len() * 2)
+                .zip(flat.par_chunks_mut(n))
+                .enumerate()
+                .for_each(|(c, (state, out))| sos_block(sos, state, xa.row(c).iter().copied(), out));
+        }
+
+        let result = numpy::ndarray::Array2::from_shape_vec((rows, n), flat)
+            .map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e.to_string()))?;
+        Ok(result.into_pyarray(py))
+    }
+
+    /// Clears the section delay registers.
+    fn reset(&mut self) {
+        self.state.iter_mut().for_each(|v| *v = 0.0);
+    }
+
+    #[getter]
+    fn channels(&self) -> usize {
+        self.channels
+    }
+
+    #[getter]
+    fn n_sections(&self) -> usize {
+        self.sos.len()
+    }
+}
@@ -2,11 +2,14 @@ use numpy::{IntoPyArray, PyReadonlyArray1};
 use pyo3::prelude::*;
 use rayon::prelude::*;
 
+use crate::simd;
+
 /// L2 norm: sqrt(sum(x^2)) — Euclidean length of the vector.
 #[pyfunction]
 pub fn prime_l2_norm(x: PyReadonlyArray1<f64>) -> PyResult<f64> {
     let xs = x.as_slice()?;
-    Ok(xs.par_iter().map(|&a| a * a).sum::<f64>().sqrt())
+    let sum_sq: f64 = xs.par_chunks(simd::CHUNK).map(simd::sum_sq_f64).sum();
+    Ok(sum_sq.sqrt())
 }
 
 /// L∞ norm: max(|x|) — the largest absolute value in the vector.
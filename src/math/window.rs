@@ -0,0 +1,101 @@
+use numpy::{IntoPyArray, PyArray1};
+use pyo3::prelude::*;
+use std::collections::HashMap;
+use std::f64::consts::PI;
+use std::sync::{Arc, Mutex, OnceLock};
+
+/// Cache key: window name, length and the bit pattern of `beta` (Kaiser only).
+type WindowKey = (&'static str, usize, u64);
+
+static CACHE: OnceLock<Mutex<HashMap<WindowKey, Arc<Vec<f64>>>>> = OnceLock::new();
+
+/// Most windows kept at once; the cache is emptied when it fills up, so
+/// sweeping `n` or Kaiser `beta` cannot grow memory without bound.
+const CACHE_MAX_ENTRIES: usize = 64;
+
+/// Longer windows are computed on every call instead of being cached.
+const CACHE_MAX_LEN: usize = 1 << 16;
+
+/// Modified Bessel function of the first kind, order 0 (power series).
+fn bessel_i0(x: f64) -> f64 {
+    let q = x * x / 4.0;
+    let (mut term, mut sum, mut k) = (1.0, 1.0, 1.0);
+    while term > sum * 1e-17 {
+        term *= q / (k * k);
+        sum += term;
+        k += 1.0;
+    }
+    sum
+}
+
+/// Symmetric window of length `n`, using the same definitions as
+/// `np.hanning`, `np.hamming`, `np.blackman` and `np.kaiser`.
+fn compute(kind: &str, n: usize, beta: f64) -> Vec<f64> {
+    if n == 1 {
+        return vec![1.0];
+    }
+    let m = (n as f64) - 1.0;
+    (0..n)
+        .map(|i| {
+            let t = 2.0 * PI * i as f64 / m;
+            match kind {
+                "hann" => 0.5 - 0.5 * t.cos(),
+                "hamming" => 0.54 - 0.46 * t.cos(),
+                "blackman" => 0.42 - 0.5 * t.cos() + 0.08 * (2.0 * t).cos(),
+                _ => {
+                    let r = 2.0 * i as f64 / m - 1.0;
+                    bessel_i0(beta * (1.0 - r * r).max(0.0).sqrt()) / bessel_i0(beta)
+                }
+            }
+        })
+        .collect()
+}
+
+/// Returns a window function, computing it only on the first request.
+///
+/// `kind` is one of "hann", "hamming", "blackman" or "kaiser" (which uses
+/// `beta`). Repeated calls with the same arguments copy from a bounded
+/// process-wide cache instead of re-evaluating the cosines / Bessel series.
+#[pyfunction]
+#[pyo3(signature = (kind, n, beta=0.0))]
+pub fn prime_window<'py>(
+    py: Python<'py>,
+    kind: &str,
+    n: usize,
+    beta: f64,
+) -> PyResult<Bound<'py, PyArray1<f64>>> {
+    let name: &'static str = match kind.to_ascii_lowercase().as_str() {
+        "hann" | "hanning" => "hann",
+        "hamming" => "hamming",
+        "blackman" => "blackman",
+        "kaiser" => "kaiser",
+        _ => {
+            return Err(PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                "Unknown window '{kind}' (expected hann, hamming, blackman or kaiser)"
+            )))
+        }
+    };
+    let beta = if name == "kaiser" { beta } else { 0.0 };
+
+    if n > CACHE_MAX_LEN {
+        return Ok(compute(name, n, beta).into_pyarray(py));
+    }
+
+    let cache = CACHE.get_or_init(|| Mutex::new(HashMap::new()));
+    let key = (name, n, beta.to_bits());
+    let cached = cache.lock().unwrap().get(&key).cloned();
+    let window = match cached {
+        Some(w) => w,
+        None => {
+            let w = Arc::new(compute(name, n, beta));
+            let mut map = cache.lock().unwrap();
+            if map.len() >= CACHE_MAX_ENTRIES {
+                map.clear();
+            }
+            map.insert(key, Arc::clone(&w));
+            w
+        }
+    };
+
+    Ok(window.as_slice().to_vec().into_pyarray(py))
+}
@@ -0,0 +1,56 @@
+use pyo3::prelude::*;
+use pyo3::types::PyDict;
+
+use super::Isa;
+
+/// Reports detected CPU features and the ISA variant kernels dispatch to.
+///
+/// Returns a dict with `features` (name → bool), `supported_isas`,
+/// `active_isa`, `best_isa`, `forced` (the pinned ISA, or None when selection
+/// is automatic), `env` (the raw `AP_FORCE_ISA` value, or None) and
+/// `fallback` (why `AP_FORCE_ISA` was ignored at import, or None).
+#[pyfunction]
+pub fn prime_cpu_features(py: Python<'_>) -> PyResult<Bound<'_, PyDict>> {
+    let features = PyDict::new(py);
+    #[cfg(target_arch = "x86_64")]
+    {
+        features.set_item("sse2", std::is_x86_feature_detected!("sse2"))?;
+        features.set_item("sse4.2", std::is_x86_feature_detected!("sse4.2"))?;
+        features.set_item("avx", std::is_x86_feature_detected!("avx"))?;
+        features.set_item("avx2", std::is_x86_feature_detected!("avx2"))?;
+        features.set_item("fma", std::is_x86_feature_detected!("fma"))?;
+        features.set_item("avx512f", std::is_x86_feature_detected!("avx512f"))?;
+    }
+
+    let supported: Vec<&str> = Isa::ALL
+        .into_iter()
+        .filter(|isa| isa.is_supported())
+        .map(|isa| isa.name())
+        .collect();
+
+    let info = PyDict::new(py);
+    info.set_item("arch", std::env::consts::ARCH)?;
+    info.set_item("features", features)?;
+    info.set_item("supported_isas", supported)?;
+    info.set_item("active_isa", super::active().name())?;
+    info.set_item("best_isa", super::best().name())?;
+    info.set_item("forced", super::forced().map(|isa| isa.name()))?;
+    info.set_item("env", std::env::var(super::FORCE_ENV).ok())?;
+    info.set_item("fallback", super::fallback())?;
+    Ok(info)
+}
+
+/// Switches the ISA variant used by dispatched kernels (e.g. for benchmarks).
+///
+/// `"auto"` restores the best supported variant. Raises ValueError for
+/// unknown names or ISAs the CPU cannot execute.
+#[pyfunction]
+pub fn prime_force_isa(name: &str) -> PyResult<String> {
+    let isa = if name.trim().eq_ignore_ascii_case("auto") {
+        None
+    } else {
+        Some(super::parse(name).map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e))?)
+    };
+    let active = super::force(isa).map_err(|e| PyErr::new::<pyo3::exceptions::PyValueError, _>(e))?;
+    Ok(active.name().to_string())
+}
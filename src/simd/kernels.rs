@@ -0,0 +1,111 @@
+//! Portable inner loops shared by every ISA variant.
+//!
+//! Each kernel is `#[inline(always)]` so that it gets compiled *inside* the
+//! `#[target_feature]` wrappers in `simd/mod.rs`, letting LLVM vectorize the
+//! same source for AVX2/FMA and AVX-512. Reductions keep `LANES` independent
+//! accumulators because LLVM will not reorder a single serial f64 sum.
+//! The `FMA` parameter selects `mul_add`, which is only fast when the target
+//! has hardware FMA (otherwise it falls back to a libm call).
+
+const LANES: usize = 16;
+
+#[inline(always)]
+fn madd_f64<const FMA: bool>(a: f64, b: f64, acc: f64) -> f64 {
+    if FMA { a.mul_add(b, acc) } else { acc + a * b }
+}
+
+#[inline(always)]
+fn madd_f32<const FMA: bool>(a: f32, b: f32, acc: f32) -> f32 {
+    if FMA { a.mul_add(b, acc) } else { acc + a * b }
+}
+
+#[inline(always)]
+pub fn dot_f64<const FMA: bool>(xs: &[f64], ys: &[f64]) -> f64 {
+    let n = xs.len().min(ys.len());
+    let (xs, ys) = (&xs[..n], &ys[..n]);
+    let mut acc = [0.0_f64; LANES];
+    let mut xc = xs.chunks_exact(LANES);
+    let mut yc = ys.chunks_exact(LANES);
+    for (a, b) in (&mut xc).zip(&mut yc) {
+        for l in 0..LANES {
+            acc[l] = madd_f64::<FMA>(a[l], b[l], acc[l]);
+        }
+    }
+    let mut tail = 0.0;
+    for (&a, &b) in xc.remainder().iter().zip(yc.remainder()) {
+        tail = madd_f64::<FMA>(a, b, tail);
+    }
+    acc.iter().sum::<f64>() + tail
+}
+
+#[inline(always)]
+pub fn sum_sq_f64<const FMA: bool>(xs: &[f64]) -> f64 {
+    let mut acc = [0.0_f64; LANES];
+    let mut xc = xs.chunks_exact(LANES);
+    for a in &mut xc {
+        for l in 0..LANES {
+            acc[l] = madd_f64::<FMA>(a[l], a[l], acc[l]);
+        }
+    }
+    let mut tail = 0.0;
+    for &a in xc.remainder() {
+        tail = madd_f64::<FMA>(a, a, tail);
+    }
+    acc.iter().sum::<f64>() + tail
+}
+
+#[inline(always)]
+pub fn add_f64<const FMA: bool>(xs: &[f64], ys: &[f64], out: &mut [f64]) {
+    for ((o, &a), &b) in out.iter_mut().zip(xs).zip(ys) {
+        *o = a + b;
+    }
+}
+
+#[inline(always)]
+pub fn rotate_f64<const FMA: bool>(
+    xs: &[f64],
+    ys: &[f64],
+    c: f64,
+    s: f64,
+    out_x: &mut [f64],
+    out_y: &mut [f64],
+) {
+    for (((ox, oy), &px), &py) in out_x.iter_mut().zip(out_y.iter_mut()).zip(xs).zip(ys) {
+        *ox = madd_f64::<FMA>(px, c, -(py * s));
+        *oy = madd_f64::<FMA>(px, s, py * c);
+    }
+}
+
+#[inline(always)]
+pub fn dot_f32<const FMA: bool>(xs: &[f32], ys: &[f32]) -> f32 {
+    let n = xs.len().min(ys.len());
+    let (xs, ys) = (&xs[..n], &ys[..n]);
+    let mut acc = [0.0_f32; 2 * LANES];
+    let mut xc = xs.chunks_exact(2 * LANES);
+    let mut yc = ys.chunks_exact(2 * LANES);
+    for (a, b) in (&mut xc).zip(&mut yc) {
+        for l in 0..2 * LANES {
+            acc[l] = madd_f32::<FMA>(a[l], b[l], acc[l]);
+        }
+    }
+    let mut tail = 0.0;
+    for (&a, &b) in xc.remainder().iter().zip(yc.remainder()) {
+        tail = madd_f32::<FMA>(a, b, tail);
+    }
+    acc.iter().sum::<f32>() + tail
+}
+
+#[inline(always)]
+pub fn rotate_f32<const FMA: bool>(
+    xs: &[f32],
+    ys: &[f32],
+    c: f32,
+    s: f32,
+    out_x: &mut [f32],
+    out_y: &mut [f32],
+) {
+    for (((ox, oy), &px), &py) in out_x.iter_mut().zip(out_y.iter_mut()).zip(xs).zip(ys) {
+        *ox = madd_f32::<FMA>(px, c, -(py * s));
+        *oy = madd_f32::<FMA>(px, s, py * c);
+    }
+}
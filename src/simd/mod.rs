@@ -0,0 +1,203 @@
+//! Runtime CPU-feature dispatch for the hot 1D kernels.
+//!
+//! The wheel is built for a generic x86-64 target, so every kernel in
+//! `kernels.rs` is compiled several times: once for the baseline target and
+//! once per ISA listed in [`Isa`] via `#[target_feature]`. The best variant
+//! supported by the host is selected once at module init (see [`init`]) and
+//! can be pinned with the `AP_FORCE_ISA` environment variable.
+
+pub mod cpu;
+mod kernels;
+
+use std::sync::atomic::{AtomicU8, Ordering};
+use std::sync::OnceLock;
+
+/// Elements handed to one Rayon task. Large enough to amortize scheduling,
+/// small enough (128 KiB of f64) to stay resident in L2 while vectorized.
+pub const CHUNK: usize = 16 * 1024;
+
+/// Environment variable that overrides automatic ISA selection.
+pub const FORCE_ENV: &str = "AP_FORCE_ISA";
+
+/// Instruction-set variants every dispatched kernel is compiled for.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+#[repr(u8)]
+pub enum Isa {
+    /// Baseline target of the build (SSE2 on x86-64).
+    Generic = 0,
+    /// AVX2 + FMA (Haswell and later).
+    Avx2 = 1,
+    /// AVX-512F on top of AVX2 + FMA (Skylake-SP and later).
+    Avx512 = 2,
+}
+
+impl Isa {
+    pub const ALL: [Isa; 3] = [Isa::Generic, Isa::Avx2, Isa::Avx512];
+
+    pub fn name(self) -> &'static str {
+        match self {
+            Isa::Generic => "generic",
+            Isa::Avx2 => "avx2",
+            Isa::Avx512 => "avx512",
+        }
+    }
+
+    pub fn from_name(name: &str) -> Option<Isa> {
+        Isa::ALL
+            .into_iter()
+            .find(|isa| isa.name().eq_ignore_ascii_case(name.trim()))
+    }
+
+    /// Whether the running CPU can execute this variant.
+    pub fn is_supported(self) -> bool {
+        match self {
+            Isa::Generic => true,
+            #[cfg(target_arch = "x86_64")]
+            Isa::Avx2 => {
+                std::is_x86_feature_detected!("avx2") && std::is_x86_feature_detected!("fma")
+            }
+            #[cfg(target_arch = "x86_64")]
+            Isa::Avx512 => Isa::Avx2.is_supported() && std::is_x86_feature_detected!("avx512f"),
+            #[cfg(not(target_arch = "x86_64"))]
+            _ => false,
+        }
+    }
+
+    fn from_u8(v: u8) -> Isa {
+        match v {
+            2 => Isa::Avx512,
+            1 => Isa::Avx2,
+            _ => Isa::Generic,
+        }
+    }
+}
+
+static ACTIVE: AtomicU8 = AtomicU8::new(Isa::Generic as u8);
+
+/// Sentinel stored in [`FORCED`] while selection is automatic.
+const NOT_FORCED: u8 = u8::MAX;
+
+/// The explicitly pinned variant (via `AP_FORCE_ISA` or `force_isa`), if any.
+static FORCED: AtomicU8 = AtomicU8::new(NOT_FORCED);
+
+/// Why a requested `AP_FORCE_ISA` was ignored at init, if it was.
+static FALLBACK: OnceLock<String> = OnceLock::new();
+
+/// The best ISA variant the running CPU supports.
+pub fn best() -> Isa {
+    Isa::ALL
+        .into_iter()
+        .rev()
+        .find(|isa| isa.is_supported())
+        .unwrap_or(Isa::Generic)
+}
+
+/// The ISA variant currently used by dispatched kernels.
+pub fn active() -> Isa {
+    Isa::from_u8(ACTIVE.load(Ordering::Relaxed))
+}
+
+/// Pins the active variant (`Some`) or restores automatic selection (`None`),
+/// refusing ISAs the CPU cannot execute.
+pub fn force(isa: Option<Isa>) -> Result<Isa, String> {
+    let target = isa.unwrap_or_else(best);
+    if !target.is_supported() {
+        return Err(format!("ISA '{}' is not supported by this CPU", target.name()));
+    }
+    ACTIVE.store(target as u8, Ordering::Relaxed);
+    FORCED.store(isa.map_or(NOT_FORCED, |i| i as u8), Ordering::Relaxed);
+    Ok(target)
+}
+
+/// The explicitly pinned variant, or `None` under automatic selection.
+pub fn forced() -> Option<Isa> {
+    match FORCED.load(Ordering::Relaxed) {
+        NOT_FORCED => None,
+        v => Some(Isa::from_u8(v)),
+    }
+}
+
+/// The reason `AP_FORCE_ISA` was ignored at init, if it was.
+pub fn fallback() -> Option<&'static str> {
+    FALLBACK.get().map(String::as_str)
+}
+
+/// Parses an ISA name, listing the valid choices on failure.
+pub fn parse(name: &str) -> Result<Isa, String> {
+    Isa::from_name(name).ok_or_else(|| {
+        let valid: Vec<&str> = Isa::ALL.iter().map(|isa| isa.name()).collect();
+        format!("Unknown ISA '{}' (expected one of: {})", name, valid.join(", "))
+    })
+}
+
+/// Selects the active variant once at module init.
+///
+/// Honours `AP_FORCE_ISA` when set (an empty value or "auto" means automatic),
+/// otherwise picks [`best`]. An unknown or unsupported value never fails the
+/// import: selection falls back to [`best`] and the reason is kept for
+/// [`fallback`] so the Python layer can warn about it.
+pub fn init() -> Isa {
+    let requested = match std::env::var(FORCE_ENV) {
+        Ok(name) if !name.trim().is_empty() && !name.trim().eq_ignore_ascii_case("auto") => {
+            parse(&name).map(Some)
+        }
+        _ => Ok(None),
+    };
+    match requested.and_then(force) {
+        Ok(isa) => isa,
+        Err(e) => {
+            let _ = FALLBACK.set(format!("{FORCE_ENV}: {e}; falling back to '{}'", best().name()));
+            force(None).unwrap_or(Isa::Generic)
+        }
+    }
+}
+
+/// Generates a safe dispatcher per kernel that jumps to the variant compiled
+/// for the active ISA.
+macro_rules! multiversion {
+    ($(
+        $(#[$meta:meta])*
+        pub fn $name:ident($($arg:ident: $ty:ty),*) $(-> $ret:ty)?;
+    )*) => {$(
+        $(#[$meta])*
+        #[inline]
+        pub fn $name($($arg: $ty),*) $(-> $ret)? {
+            #[cfg(target_arch = "x86_64")]
+            {
+                #[target_feature(enable = "avx512f,avx2,fma")]
+                unsafe fn avx512($($arg: $ty),*) $(-> $ret)? {
+                    kernels::$name::<true>($($arg),*)
+                }
+
+                #[target_feature(enable = "avx2,fma")]
+                unsafe fn avx2($($arg: $ty),*) $(-> $ret)? {
+                    kernels::$name::<true>($($arg),*)
+                }
+
+                // SAFETY: `force()` is the only store to `ACTIVE`, and it
+                // rejects any ISA for which `Isa::is_supported()` is false.
+                match active() {
+                    Isa::Avx512 => return unsafe { avx512($($arg),*) },
+                    Isa::Avx2 => return unsafe { avx2($($arg),*) },
+                    Isa::Generic => {}
+                }
+            }
+            kernels::$name::<false>($($arg),*)
+        }
+    )*};
+}
+
+multiversion! {
+    /// Dot product of two equal-length slices.
+    pub fn dot_f64(xs: &[f64], ys: &[f64]) -> f64;
+    /// Sum of squares (squared L2 norm).
+    pub fn sum_sq_f64(xs: &[f64]) -> f64;
+    /// Element-wise `out = xs + ys`.
+    pub fn add_f64(xs: &[f64], ys: &[f64], out: &mut [f64]);
+    /// Rotates points by the angle whose cosine/sine are `c`/`s`.
+    pub fn rotate_f64(xs: &[f64], ys: &[f64], c: f64, s: f64, out_x: &mut [f64], out_y: &mut [f64]);
+    /// Single-precision dot product.
+    pub fn dot_f32(xs: &[f32], ys: &[f32]) -> f32;
+    /// Single-precision 2D rotation.
+    pub fn rotate_f32(xs: &[f32], ys: &[f32], c: f32, s: f32, out_x: &mut [f32], out_y: &mut [f32]);
+}
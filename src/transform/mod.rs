@@ -2,6 +2,8 @@ use numpy::{IntoPyArray, PyReadonlyArray1};
 use pyo3::prelude::*;
 use rayon::prelude::*;
 
+use crate::simd;
+
 /// Multiplies every element of `x` by scalar `s`.
 #[pyfunction]
 pub fn prime_scale<'py>(
@@ -17,6 +19,7 @@ pub fn prime_scale<'py>(
 ///
 /// This is a fused kernel: both output arrays are computed in a single
 /// parallel pass, avoiding the multiple memory sweeps NumPy would require.
+/// Each chunk runs the SIMD variant selected at module init.
 #[pyfunction]
 pub fn prime_rotate_2d<'py>(
     py: Python<'py>,
@@ -33,12 +36,15 @@ pub fn prime_rotate_2d<'py>(
     let c = angle_rad.cos();
     let s = angle_rad.sin();
 
-    // Rayon unzip computes both new_x and new_y simultaneously in one pass.
-    let (res_x, res_y): (Vec<f64>, Vec<f64>) = xs
-        .par_iter()
-        .zip(ys.par_iter())
-        .map(|(&px, &py_val)| (px * c - py_val * s, px * s + py_val * c))
-        .unzip();
+    let mut res_x = vec![0.0; xs.len()];
+    let mut res_y = vec![0.0; xs.len()];
+
+    // Both new_x and new_y are written simultaneously in one pass per chunk.
+    res_x
+        .par_chunks_mut(simd::CHUNK)
+        .zip(res_y.par_chunks_mut(simd::CHUNK))
+        .zip(xs.par_chunks(simd::CHUNK).zip(ys.par_chunks(simd::CHUNK)))
+        .for_each(|((ox, oy), (px, py_val))| simd::rotate_f64(px, py_val, c, s, ox, oy));
 
     Ok((res_x.into_pyarray(py), res_y.into_pyarray(py)))
 }
@@ -0,0 +1,10 @@
+import pytest
+import aranya_prime as ap
+
+
+@pytest.fixture(params=ap.cpu_features()["supported_isas"])
+def simd_isa(request):
+    """Runs a test once per SIMD variant the host supports."""
+    ap.force_isa(request.param)
+    yield request.param
+    ap.force_isa("auto")
@@ -243,3 +243,74 @@ def test_matmul_scaling_aranya(benchmark, rng, dim):
     A = rng.random((dim, dim), dtype=np.float64)
     B = rng.random((dim, dim), dtype=np.float64)
     benchmark(ap.matmul, A, B, True)
+
+
+# Compare the multiversioned SIMD variants of the dispatched kernels
+# (`simd_isa` comes from conftest.py).
+@pytest.mark.benchmark(group="dot-isa")
+def test_dot_isa(benchmark, rng, simd_isa):
+    x = rng.random(1_000_000, dtype=np.float64)
+    y = rng.random(1_000_000, dtype=np.float64)
+    benchmark(ap.dot, x, y, False)
+
+
+@pytest.mark.benchmark(group="add-isa")
+def test_add_isa(benchmark, rng, simd_isa):
+    x = rng.random(1_000_000, dtype=np.float64)
+    y = rng.random(1_000_000, dtype=np.float64)
+    benchmark(ap.add, x, y)
+
+
+@pytest.mark.benchmark(group="l2-norm-isa")
+def test_l2_norm_isa(benchmark, rng, simd_isa):
+    x = rng.random(1_000_000, dtype=np.float64)
+    benchmark(ap.l2_norm, x)
+
+
+@pytest.mark.benchmark(group="rotate-isa")
+def test_rotate_2d_isa(benchmark, rng, simd_isa):
+    x = rng.random(1_000_000, dtype=np.float64)
+    y = rng.random(1_000_000, dtype=np.float64)
+    benchmark(ap.rotate_2d, x, y, 0.5)
+
+
+@pytest.mark.benchmark(group="dot-f32-isa")
+def test_dot_f32_isa(benchmark, rng, simd_isa):
+    x = rng.random(1_000_000, dtype=np.float32)
+    y = rng.random(1_000_000, dtype=np.float32)
+    benchmark(ap.f32.dot, x, y)
+
+
+@pytest.mark.benchmark(group="polyval")
+@pytest.mark.parametrize("degree", [5, 20])
+def test_polyval_numpy(benchmark, rng, degree):
+    c = rng.random(degree + 1)
+    x = rng.random(1_000_000)
+    benchmark(np.polyval, c, x)
+
+
+@pytest.mark.benchmark(group="polyval")
+@pytest.mark.parametrize("method", ["auto", "horner", "estrin"])
+@pytest.mark.parametrize("degree", [5, 20])
+def test_polyval_aranya(benchmark, rng, degree, method):
+    c = rng.random(degree + 1)
+    x = rng.random(1_000_000)
+    benchmark(ap.polyval, c, x, method)
+
+
+@pytest.mark.benchmark(group="polyval-batch")
+def test_polyval_batch_numpy(benchmark, rng):
+    C = rng.random((2_000, 16))
+    X = rng.random((2_000, 512))
+
+    def loop(C, X):
+        return np.vstack([np.polyval(c, row) for c, row in zip(C, X)])
+
+    benchmark(loop, C, X)
+
+
+@pytest.mark.benchmark(group="polyval-batch")
+def test_polyval_batch_aranya(benchmark, rng):
+    C = rng.random((2_000, 16))
+    X = rng.random((2_000, 512))
+    benchmark(ap.polyval_batch, C, X)
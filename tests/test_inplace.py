@@ -0,0 +1,137 @@
+import subprocess
+import sys
+import textwrap
+
+import pytest
+import numpy as np
+import aranya_prime as ap
+
+
+def test_normalize_batch_inplace_matches_copy():
+    X = np.random.rand(257, 33)
+    X[3] = 0.0
+    ref = ap.normalize_batch(X)
+
+    out = ap.normalize_batch(X, inplace=True)
+    assert out is X
+    np.testing.assert_allclose(X, ref, atol=1e-15)
+    np.testing.assert_allclose(np.linalg.norm(X[4:], axis=1), 1.0, atol=1e-12)
+    assert not X[3].any()
+
+
+def test_normalize_batch_inplace_non_contiguous():
+    F = np.asfortranarray(np.random.rand(64, 16))
+    ref = F / np.linalg.norm(F, axis=1, keepdims=True)
+    ap.normalize_batch(F, inplace=True)
+    np.testing.assert_allclose(F, ref, atol=1e-15)
+
+    base = np.random.rand(64, 32)
+    view = base[:, ::2]
+    ref = view / np.linalg.norm(view, axis=1, keepdims=True)
+    ap.normalize_batch(view, inplace=True)
+    np.testing.assert_allclose(base[:, ::2], ref, atol=1e-15)
+
+
+@pytest.mark.parametrize("shape", [(5_000, 48), (8, 200_000)])
+def test_normalize_batch_inplace_fortran_large(shape):
+    # Tall matrices split rows across tasks; wide ones split columns.
+    F = np.asfortranarray(np.random.rand(*shape))
+    F[3] = 0.0
+    ref = ap.normalize_batch(np.ascontiguousarray(F))
+    ap.normalize_batch(F, inplace=True)
+    assert F.flags.f_contiguous
+    np.testing.assert_allclose(F, ref, atol=1e-15)
+    assert not F[3].any()
+
+
+def test_normalize_batch_inplace_rejects_readonly():
+    X = np.random.rand(8, 4)
+    X.flags.writeable = False
+    before = X.copy()
+    with pytest.raises(ValueError, match="writeable"):
+        ap.normalize_batch(X, inplace=True)
+    np.testing.assert_array_equal(X, before)
+
+    with pytest.raises(TypeError, match="float64"):
+        ap.normalize_batch(X.astype(np.float32), inplace=True)
+
+
+@pytest.mark.parametrize("order", ["C", "F"])
+@pytest.mark.parametrize("shape", [(40, 40), (60, 25), (25, 60)])
+def test_svd_overwrite_a(order, shape):
+    A = np.asarray(np.random.rand(*shape), order=order)
+    ref_s = np.linalg.svd(A, compute_uv=False)
+    A_copy = A.copy()
+
+    U, S, Vh = ap.svd(A, overwrite_a=True)
+    np.testing.assert_allclose(S, ref_s, atol=1e-10)
+    k = min(shape)
+    np.testing.assert_allclose((U[:, :k] * S) @ Vh[:k], A_copy, atol=1e-10)
+
+
+def test_svd_overwrite_a_falls_back_for_unusable_buffers():
+    A = np.random.rand(20, 20)
+    _, ref_s, _ = ap.svd(A)
+
+    readonly = A.copy()
+    readonly.flags.writeable = False
+    strided = np.random.rand(20, 40)
+    strided[:, ::2] = A
+    view = strided[:, ::2]
+
+    for arg in (A.tolist(), readonly, view):
+        _, S, _ = ap.svd(arg, overwrite_a=True)
+        np.testing.assert_allclose(S, ref_s, atol=1e-12)
+    np.testing.assert_array_equal(readonly, A)
+    np.testing.assert_array_equal(view, A)
+
+
+# ── Peak memory ───────────────────────────────────────────────────────────────
+# Each measurement runs in a fresh interpreter so ru_maxrss reflects only the
+# operation under test (it is a process-wide high-water mark).
+
+def _peak_growth_mb(setup, op):
+    script = textwrap.dedent(
+        """
+        import resource
+        import numpy as np
+        import aranya_prime as ap
+
+        def peak_mb():
+            return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+        {setup}
+        before = peak_mb()
+        {op}
+        print(peak_mb() - before)
+        """
+    ).format(setup=setup, op=op)
+    out = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True)
+    return float(out.stdout.split()[-1])
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="ru_maxrss units are Linux-specific")
+def test_normalize_batch_inplace_peak_rss():
+    rows, cols = 4_000, 5_000   # 160 MB matrix
+    size_mb = rows * cols * 8 / 2**20
+    setup = f"X = np.random.default_rng(0).random(({rows}, {cols}))"
+
+    growth_copy = _peak_growth_mb(setup, "Y = ap.normalize_batch(X)")
+    growth_inplace = _peak_growth_mb(setup, "ap.normalize_batch(X, inplace=True)")
+
+    assert growth_copy > 0.8 * size_mb
+    assert growth_inplace < 0.25 * size_mb
+
+
+@pytest.mark.skipif(not sys.platform.startswith("linux"), reason="ru_maxrss units are Linux-specific")
+def test_svd_overwrite_a_peak_rss():
+    n = 1_500   # 18 MB matrix; U and Vh are the same size again
+    size_mb = n * n * 8 / 2**20
+    # Warm up LAPACK so thread buffers are allocated before the baseline.
+    setup = f"ap.svd(np.eye(8)); A = np.random.default_rng(0).random(({n}, {n}))"
+
+    growth_copy = _peak_growth_mb(setup, "r = ap.svd(A)")
+    growth_inplace = _peak_growth_mb(setup, "r = ap.svd(A, overwrite_a=True)")
+
+    # Both allocate U and Vh; only the copying path also clones A.
+    assert growth_copy - growth_inplace > 0.6 * size_mb
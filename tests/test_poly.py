@@ -0,0 +1,48 @@
+import pytest
+import numpy as np
+import aranya_prime as ap
+
+
+@pytest.mark.parametrize("method", ["auto", "horner", "estrin"])
+@pytest.mark.parametrize("degree", [0, 1, 5, 8, 13, 20, 80])
+def test_polyval_matches_numpy(method, degree):
+    coeffs = np.random.uniform(-1, 1, degree + 1)
+    x = np.random.uniform(-1.1, 1.1, 10_001)
+    np.testing.assert_allclose(ap.polyval(coeffs, x, method), np.polyval(coeffs, x), rtol=1e-10, atol=1e-12)
+
+
+def test_polyval_edge_cases():
+    x = np.array([0.0, 1.0, -2.0])
+    np.testing.assert_array_equal(ap.polyval(np.array([]), x), np.zeros(3))
+    assert ap.polyval(np.array([1.0, 2.0]), np.array([])).size == 0
+    with pytest.raises(ValueError, match="Unknown method"):
+        ap.polyval(np.ones(3), x, "ruffini")
+
+
+def test_polyval_batch():
+    C = np.random.uniform(-1, 1, (300, 16))
+    X = np.random.uniform(-1, 1, (300, 257))
+    ref = np.vstack([np.polyval(c, row) for c, row in zip(C, X)])
+    np.testing.assert_allclose(ap.polyval_batch(C, X), ref, rtol=1e-10, atol=1e-12)
+
+    with pytest.raises(ValueError, match="Shape mismatch"):
+        ap.polyval_batch(C[:10], X)
+
+
+@pytest.mark.parametrize("degree", [0, 1, 2, 15])
+def test_chebval_matches_numpy(degree):
+    c = np.random.uniform(-1, 1, degree + 1)
+    x = np.linspace(-1, 1, 1001)
+    np.testing.assert_allclose(ap.chebval(c, x), np.polynomial.chebyshev.chebval(x, c), atol=1e-12)
+
+
+def test_roots_matches_numpy():
+    p = np.poly([1.0, -2.0, 3.5, 0.25])
+    np.testing.assert_allclose(np.sort(ap.roots(p).real), [-2.0, 0.25, 1.0, 3.5], atol=1e-9)
+
+    p = np.array([0.0, 1.0, 0.0, 1.0, 0.0, 0.0])   # x^4 + x^2 = x^2 (x^2 + 1)
+    r = ap.roots(p)
+    np.testing.assert_allclose(np.sort_complex(r), np.sort_complex(np.roots(p)), atol=1e-9)
+
+    assert ap.roots(np.array([0.0, 0.0])).size == 0
+    assert ap.roots(np.array([3.0])).size == 0
@@ -0,0 +1,112 @@
+import pytest
+import numpy as np
+import aranya_prime as ap
+
+
+def sosfilt_ref(sos, x):
+    """Plain-Python cascade of biquads (direct form I)."""
+    y = np.array(x, dtype=np.float64)
+    for b0, b1, b2, a0, a1, a2 in sos:
+        b0, b1, b2, a1, a2 = b0 / a0, b1 / a0, b2 / a0, a1 / a0, a2 / a0
+        out = np.zeros_like(y)
+        x1 = x2 = y1 = y2 = 0.0
+        for n, v in enumerate(y):
+            out[n] = b0 * v + b1 * x1 + b2 * x2 - a1 * y1 - a2 * y2
+            x1, x2, y1, y2 = v, x1, out[n], y1
+        y = out
+    return y
+
+
+SOS = np.array([
+    [0.2, 0.4, 0.2, 1.0, -0.3, 0.1],
+    [1.0, -1.0, 0.5, 2.0, 0.4, 0.2],
+])
+
+
+def test_fir_blockwise_matches_full_convolution():
+    taps = np.random.rand(31)
+    x = np.random.rand(10_000)
+    fir = ap.signal.FIR(taps)
+
+    out = np.concatenate([fir.process(b) for b in np.array_split(x, 37)])
+    np.testing.assert_allclose(out, np.convolve(x, taps)[: x.size], atol=1e-12)
+
+
+def test_fir_multichannel_and_reset():
+    taps = np.random.rand(8)
+    X = np.random.rand(5, 3_000)
+    fir = ap.signal.FIR(taps, channels=5)
+    assert fir.channels == 5
+
+    out = np.hstack([fir.process_channels(X[:, i:i + 250]) for i in range(0, 3_000, 250)])
+    ref = np.vstack([np.convolve(row, taps)[: row.size] for row in X])
+    np.testing.assert_allclose(out, ref, atol=1e-12)
+
+    fir.reset()
+    np.testing.assert_allclose(fir.process_channels(X), ref, atol=1e-12)
+
+    with pytest.raises(ValueError, match="channel"):
+        fir.process_channels(X[:3])
+    with pytest.raises(ValueError, match="channel"):
+        fir.process(X[0])
+
+
+def test_iir_blockwise_matches_reference():
+    x = np.random.rand(2_000)
+    iir = ap.signal.IIR(SOS)
+    assert iir.n_sections == 2
+
+    out = np.concatenate([iir.process(b) for b in np.array_split(x, 13)])
+    np.testing.assert_allclose(out, sosfilt_ref(SOS, x), atol=1e-12)
+
+
+def test_iir_multichannel():
+    X = np.random.rand(3, 1_000)
+    iir = ap.signal.IIR(SOS, channels=3)
+    out = np.hstack([iir.process_channels(X[:, :400]), iir.process_channels(X[:, 400:])])
+    ref = np.vstack([sosfilt_ref(SOS, row) for row in X])
+    np.testing.assert_allclose(out, ref, atol=1e-12)
+
+
+def test_filter_validation():
+    with pytest.raises(ValueError):
+        ap.signal.FIR(np.array([]))
+    with pytest.raises(ValueError, match="shape"):
+        ap.signal.IIR(np.ones((2, 5)))
+    with pytest.raises(ValueError, match="a0"):
+        ap.signal.IIR(np.array([[1.0, 0.0, 0.0, 0.0, 0.0, 0.0]]))
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 7, 512])
+def test_windows_match_numpy(n):
+    np.testing.assert_allclose(ap.signal.hann(n), np.hanning(n), atol=1e-12)
+    np.testing.assert_allclose(ap.signal.hamming(n), np.hamming(n), atol=1e-12)
+    np.testing.assert_allclose(ap.signal.blackman(n), np.blackman(n), atol=1e-12)
+    np.testing.assert_allclose(ap.signal.kaiser(n, 8.6), np.kaiser(n, 8.6), atol=1e-12)
+
+
+def test_window_by_name_and_cache_bound():
+    np.testing.assert_allclose(ap.signal.window("kaiser", 33, 5.0), np.kaiser(33, 5.0), atol=1e-12)
+    # Sweeping beta far past the cache capacity must keep returning correct windows.
+    for beta in np.linspace(0.0, 12.0, 500):
+        w = ap.signal.kaiser(17, beta)
+    np.testing.assert_allclose(w, np.kaiser(17, 12.0), atol=1e-12)
+    np.testing.assert_allclose(ap.signal.hann(100_000), np.hanning(100_000), atol=1e-12)
+
+
+def test_fir_small_and_large_blocks_agree():
+    taps = np.random.rand(64)
+    x = np.random.rand(20_000)
+    small, large = ap.signal.FIR(taps), ap.signal.FIR(taps)
+    out_small = np.concatenate([small.process(b) for b in np.array_split(x, 400)])
+    out_large = np.concatenate([large.process(x[:15_000]), large.process(x[15_000:])])
+    np.testing.assert_allclose(out_small, out_large, atol=1e-12)
+    np.testing.assert_allclose(out_small, np.convolve(x, taps)[: x.size], atol=1e-12)
+
+
+def test_window_cache_returns_independent_copies():
+    w1 = ap.signal.hann(64)
+    w1[:] = 0.0
+    np.testing.assert_allclose(ap.signal.hann(64), np.hanning(64), atol=1e-12)
+    with pytest.raises(ValueError, match="Unknown window"):
+        ap.signal.window("triangle", 8)
@@ -0,0 +1,75 @@
+import os
+import subprocess
+import sys
+
+import pytest
+import numpy as np
+import aranya_prime as ap
+
+
+def test_cpu_features_report():
+    info = ap.cpu_features()
+    assert "generic" in info["supported_isas"]
+    assert info["active_isa"] in info["supported_isas"]
+    assert info["best_isa"] in info["supported_isas"]
+    assert isinstance(info["features"], dict)
+
+
+def test_force_isa_rejects_unknown():
+    with pytest.raises(ValueError, match="Unknown ISA"):
+        ap.force_isa("sse9")
+    assert ap.force_isa("auto") == ap.cpu_features()["best_isa"]
+
+
+def test_forced_reports_override_state():
+    ap.force_isa("generic")
+    try:
+        info = ap.cpu_features()
+        assert info["forced"] == "generic"
+        assert info["active_isa"] == "generic"
+    finally:
+        ap.force_isa("auto")
+    assert ap.cpu_features()["forced"] is None
+
+
+@pytest.mark.parametrize("value", ["avx2x", "sse9"])
+def test_bad_force_env_warns_and_falls_back(value):
+    script = (
+        "import warnings\n"
+        "with warnings.catch_warnings(record=True) as caught:\n"
+        "    warnings.simplefilter('always')\n"
+        "    import aranya_prime as ap\n"
+        "info = ap.cpu_features()\n"
+        "print(any('AP_FORCE_ISA' in str(w.message) for w in caught),\n"
+        "      info['active_isa'] == info['best_isa'], info['forced'], bool(info['fallback']))\n"
+    )
+    env = dict(os.environ, AP_FORCE_ISA=value)
+    out = subprocess.run([sys.executable, "-c", script], env=env, capture_output=True, text=True, check=True)
+    assert out.stdout.split() == ["True", "True", "None", "True"]
+
+
+@pytest.mark.parametrize("size", [0, 1, 17, 16_385, 1_000_003])
+def test_dispatched_f64_kernels(simd_isa, size):
+    x = np.random.rand(size)
+    y = np.random.rand(size)
+
+    assert ap.cpu_features()["active_isa"] == simd_isa
+    np.testing.assert_allclose(ap.dot(x, y, auto_blas=False), np.dot(x, y), rtol=1e-12)
+    np.testing.assert_allclose(ap.l2_norm(x), np.linalg.norm(x), rtol=1e-12)
+    np.testing.assert_allclose(ap.add(x, y), x + y, atol=0)
+
+    rx, ry = ap.rotate_2d(x, y, 0.5)
+    c, s = np.cos(0.5), np.sin(0.5)
+    np.testing.assert_allclose(rx, x * c - y * s, atol=1e-15)
+    np.testing.assert_allclose(ry, x * s + y * c, atol=1e-15)
+
+
+def test_dispatched_f32_kernels(simd_isa):
+    x = np.random.rand(100_001).astype(np.float32)
+    y = np.random.rand(100_001).astype(np.float32)
+
+    np.testing.assert_allclose(ap.f32.dot(x, y), np.dot(x, y), rtol=1e-4)
+    rx, ry = ap.f32.rotate_2d(x, y, 0.5)
+    c, s = np.float32(np.cos(0.5)), np.float32(np.sin(0.5))
+    np.testing.assert_allclose(rx, x * c - y * s, atol=1e-6)
+    np.testing.assert_allclose(ry, x * s + y * c, atol=1e-6)